@@ -7,6 +7,76 @@ import pandas as pd
 
 from utils import autofill_nan_groups, add_weekday_pt, add_session_number
 
+# Columns identifying one recording session; shared by every extracted component
+MERGE_KEYS = ["subject_id", "work_type", "date", "session"]
+
+# extract_nested arguments per component
+HR_VALUE_PATHS = ["HR_BPM_stats.*", "HR_ratio_stats.*", "HR_distributions.*"]
+HR_EXCLUDE = ["HR_timeline"]
+WRIST_VALUE_PATHS = [
+    "WRIST_significant_rotation_percentage",
+    "WRIST_significant_acceleration_percentage",
+]
+NOISE_VALUE_PATHS = ["Noise_statistics.*", "Noise_distributions.*", "Noise_durations.*"]
+NOISE_EXCLUDE = ["Noise_timeline*"]
+HAR_VALUE_PATHS = ["HAR_distributions.*", "HAR_durations.*", "HAR_steps.*"]
+HAR_EXCLUDE = ["HAR_timeline*"]
+
+
+def _join_on_keys(frames, keys=MERGE_KEYS):
+    """
+    Outer-join component DataFrames on their shared session keys.
+
+    Parameters
+    ----------
+    frames : list of pd.DataFrame
+        Components to combine; empty frames are skipped.
+    keys : list of str, optional
+        Columns identifying one row in every component.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per key combination present in any component, or an empty
+        DataFrame if all components are empty.
+    """
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+
+    # Single concat along pre-sorted key indexes; raises if a component has
+    # duplicate keys
+    indexed = [f.set_index(keys).sort_index() for f in frames]
+    return pd.concat(indexed, axis=1, join="outer", sort=True).reset_index()
+
+
+def _compact_dtypes(df):
+    """
+    Store low-cardinality key columns compactly.
+
+    subject_id and work_type become categoricals (groupby/hue work on integer
+    codes) and weekday_num becomes int8 when it has no missing values.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Extracted smartwatch or smartphone DataFrame.
+
+    Returns
+    -------
+    pd.DataFrame
+        The same DataFrame with converted columns.
+    """
+    for col in ("subject_id", "work_type"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    if "weekday_num" in df.columns and df["weekday_num"].notna().all():
+        df["weekday_num"] = df["weekday_num"].astype("int8")
+    return df
+
+
 def extract_smartwatch_and_smartphone(profiles, components=("HR", "wrist", "noise", "activity")):
     """
     Extract smartwatch and smartphone metrics from OH profiles.
@@ -37,12 +107,8 @@ def extract_smartwatch_and_smartphone(profiles, components=("HR", "wrist", "nois
             profiles,
             base_path="sensor_metrics.heart_rate",
             level_names=["date", "session"],
-            value_paths=[
-                "HR_BPM_stats.*",
-                "HR_ratio_stats.*",
-                "HR_distributions.*"
-            ],
-            exclude_patterns=["HR_timeline"]
+            value_paths=HR_VALUE_PATHS,
+            exclude_patterns=HR_EXCLUDE
         )
         df_hr = autofill_nan_groups(df_hr)
 
@@ -51,26 +117,11 @@ def extract_smartwatch_and_smartphone(profiles, components=("HR", "wrist", "nois
             profiles,
             base_path="sensor_metrics.wrist_activities",
             level_names=["date", "session"],
-            value_paths=[
-                "WRIST_significant_rotation_percentage",
-                "WRIST_significant_acceleration_percentage",
-            ],
+            value_paths=WRIST_VALUE_PATHS,
         )
 
-    # Merge smartwatch components if both exist
-    if not df_hr.empty and not df_wrist.empty:
-        df_smartwatch = pd.merge(
-            df_hr,
-            df_wrist,
-            on=["subject_id", "work_type", "date", "session"],
-            how="outer"
-        )
-    elif not df_hr.empty:
-        df_smartwatch = df_hr
-    elif not df_wrist.empty:
-        df_smartwatch = df_wrist
-    else:
-        df_smartwatch = pd.DataFrame()
+    # Merge smartwatch components
+    df_smartwatch = _join_on_keys([df_hr, df_wrist])
 
     # Add weekday and session number column
     if not df_smartwatch.empty:
@@ -87,12 +138,8 @@ def extract_smartwatch_and_smartphone(profiles, components=("HR", "wrist", "nois
             profiles,
             base_path="sensor_metrics.noise",
             level_names=["date", "session"],
-            value_paths=[
-                "Noise_statistics.*",
-                "Noise_distributions.*",
-                "Noise_durations.*",
-            ],
-            exclude_patterns=["Noise_timeline*"]
+            value_paths=NOISE_VALUE_PATHS,
+            exclude_patterns=NOISE_EXCLUDE
         )
 
     if "activity" in components:
@@ -100,31 +147,15 @@ def extract_smartwatch_and_smartphone(profiles, components=("HR", "wrist", "nois
             profiles,
             base_path="sensor_metrics.human_activities",
             level_names=["date", "session"],
-            value_paths=[
-                "HAR_distributions.*",
-                "HAR_durations.*",
-                "HAR_steps.*",
-            ],
-            exclude_patterns=["HAR_timeline*"]
+            value_paths=HAR_VALUE_PATHS,
+            exclude_patterns=HAR_EXCLUDE
         )
 
-    # Merge smartphone components if both exist
-    if not df_noise.empty and not df_human.empty:
-        df_smartphone = pd.merge(
-            df_human,
-            df_noise,
-            on=["subject_id", "work_type", "date", "session"],
-            how="outer"
-        )
-    elif not df_noise.empty:
-        df_smartphone = df_noise
-    elif not df_human.empty:
-        df_smartphone = df_human
-    else:
-        df_smartphone = pd.DataFrame()
+    # Merge smartphone components
+    df_smartphone = _join_on_keys([df_human, df_noise])
 
     if not df_smartphone.empty:
         df_smartphone = autofill_nan_groups(df_smartphone)
         df_smartphone = add_weekday_pt(df_smartphone, date_col="date")
 
-    return df_smartwatch, df_smartphone
+    return _compact_dtypes(df_smartwatch), _compact_dtypes(df_smartphone)
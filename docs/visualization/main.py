@@ -6,13 +6,41 @@ from oh_parser import (
     extract_nested)
 import pandas as pd
 
+# Copy-on-Write makes the defensive copies in pandas' indexing/assignment
+# paths lazy views. It is always on from pandas 3.0, where the option is deprecated.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 from data import extract_smartwatch_and_smartphone
-from pairplot import pairplot_by_weekday, pairplot_by_weekday_and_session
+from pairplot import pairplot_by_weekday, pairplot_by_weekday_and_session, make_render_pool
+from utils import shorten_axis_labels
 
 OH_PROFILES_PATH = r"D:\Teste\metrics\Sara"
 
 COMPONENTS = ("HR", "noise", "activity", "wrist")
 
+# Set SHOW_PLOTS = False to render all pairplots in parallel into PLOTS_DIR
+SHOW_PLOTS = True
+PLOTS_DIR = "pairplots"
+
+SMARTPHONE_PREFIXES = ("Noise_statistics", "Noise_distributions", "HAR_distributions", "HAR_steps")
+SMARTWATCH_PREFIXES = ("HR_BPM_stats", "HR_ratio_stats", "HR_distributions", "WRIST_significant")
+
+
+def columns_by_prefix(df, prefixes):
+    """Map each prefix to the DataFrame columns starting with it (one scan per prefix)."""
+    names = df.columns.astype(str)
+    return {p: df.columns[names.str.startswith(p)].tolist() for p in prefixes}
+
+
+def axis_labels_by_prefix(cols_by_prefix):
+    """Build one shortened-axis-label map covering every prefix group."""
+    labels = {}
+    for prefix, cols in cols_by_prefix.items():
+        labels.update(shorten_axis_labels(cols, prefix))
+    return labels
+
+
 if __name__ == '__main__':
     OH_PROFILES_PATH = r"D:\Teste\metrics\Sara"
     profiles = load_profiles(OH_PROFILES_PATH)
@@ -33,16 +61,31 @@ if __name__ == '__main__':
     print("\nSmartphone shape:", df_smartphone.shape)
 
 
+    # One worker pool shared by every pairplot when saving to files
+    pool = None if SHOW_PLOTS else make_render_pool()
+    futures = []
+
     # SMARTPHONE pairplots per day
-    pairplot_by_weekday(df_smartphone, "Noise_statistics")
-    pairplot_by_weekday(df_smartphone, "Noise_distributions")
-    pairplot_by_weekday(df_smartphone, "HAR_distributions")
-    pairplot_by_weekday(df_smartphone, "HAR_steps")
+    smartphone_cols = columns_by_prefix(df_smartphone, SMARTPHONE_PREFIXES)
+    smartphone_labels = axis_labels_by_prefix(smartphone_cols)
+    for prefix, cols in smartphone_cols.items():
+        futures += pairplot_by_weekday(
+            df_smartphone, prefix, cols=cols, rename_map=smartphone_labels,
+            show=SHOW_PLOTS, output_dir=PLOTS_DIR, executor=pool
+        )
 
     # SMARTWATCH pairplots per session
-    pairplot_by_weekday_and_session(df_smartwatch, "HR_BPM_stats")
-    pairplot_by_weekday_and_session(df_smartwatch, "HR_ratio_stats")
-    pairplot_by_weekday_and_session(df_smartwatch, "HR_distributions")
-    pairplot_by_weekday_and_session(df_smartwatch, "WRIST_significant")
+    smartwatch_cols = columns_by_prefix(df_smartwatch, SMARTWATCH_PREFIXES)
+    smartwatch_labels = axis_labels_by_prefix(smartwatch_cols)
+    for prefix, cols in smartwatch_cols.items():
+        futures += pairplot_by_weekday_and_session(
+            df_smartwatch, prefix, cols=cols, rename_map=smartwatch_labels,
+            show=SHOW_PLOTS, output_dir=PLOTS_DIR, executor=pool
+        )
+
+    if pool is not None:
+        with pool:
+            for future in futures:
+                print(f"Saved {future.result()}")
 
 
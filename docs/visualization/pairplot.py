@@ -1,3 +1,9 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 
@@ -14,83 +20,179 @@ weekdays_pt = {
 }
 
 
-def pairplot_by_weekday(df, group_prefix, hue="work_type", weekday_col="weekday_num"):
+def pairplot_by_weekday(
+    df,
+    group_prefix,
+    hue="work_type",
+    weekday_col="weekday_num",
+    cols=None,
+    rename_map=None,
+    show=True,
+    output_dir=None,
+    executor=None
+):
     """
     Create pairplots for a metric group, split by weekday.
     Axis labels are shortened by removing the group prefix.
+
+    cols / rename_map can be passed when already known (e.g. computed once
+    for several plots) to skip the column scan and label shortening.
+
+    With show=True (default) each plot is displayed interactively in turn.
+    With show=False the plots are rendered in worker processes (Agg backend)
+    and saved as PNG files in output_dir. Pass a pool from make_render_pool()
+    as executor to share it across calls; the jobs are then only submitted
+    and their futures returned (each resolves to the saved path).
     """
-    cols = [c for c in df.columns if c.startswith(group_prefix)]
+    if cols is None:
+        cols = df.columns[df.columns.astype(str).str.startswith(group_prefix)]
+    cols = list(cols)
     if not cols:
         print(f"No columns found for prefix {group_prefix}")
-        return
+        return []
+
+    if rename_map is None:
+        rename_map = shorten_axis_labels(cols, group_prefix)
 
-    rename_map = shorten_axis_labels(cols, group_prefix)
+    # One groupby pass over only the needed columns instead of a mask per weekday
+    df_groups = df[cols + [hue, weekday_col]].groupby(weekday_col, sort=True, observed=True)
 
-    for wd in sorted(df[weekday_col].dropna().unique()):
-        df_plot = df[df[weekday_col] == wd]
+    jobs = []
+    for wd, df_plot in df_groups:
         if df_plot.shape[0] < 2:
             continue
 
         df_plot = df_plot[cols + [hue]].rename(columns=rename_map)
         df_plot = df_plot.rename(columns={hue: "Local de trabalho"})
 
-        g = sns.pairplot(
-            df_plot,
-            hue="Local de trabalho",
-            diag_kind="kde"
-        )
+        jobs.append((df_plot, f"{group_prefix} – {weekdays_pt[wd]}"))
 
-        g.fig.set_size_inches(12, 10)
-        g.fig.subplots_adjust(top=0.9)
-        g.fig.suptitle(f"{group_prefix} – {weekdays_pt[wd]}", fontsize=14)
-
-        plt.show()
+    return _render_all(jobs, show, output_dir, executor)
 
 def pairplot_by_weekday_and_session(
     df,
     group_prefix,
     hue="work_type",
     weekday_col="weekday_num",
-    session_col="n_session"
+    session_col="n_session",
+    cols=None,
+    rename_map=None,
+    show=True,
+    output_dir=None,
+    executor=None
 ):
     """
     Create pairplots for a metric group, split by weekday and session number.
     Axis labels are shortened by removing the group prefix.
+
+    cols / rename_map can be passed when already known (e.g. computed once
+    for several plots) to skip the column scan and label shortening.
+
+    With show=True (default) each plot is displayed interactively in turn.
+    With show=False the plots are rendered in worker processes (Agg backend)
+    and saved as PNG files in output_dir. Pass a pool from make_render_pool()
+    as executor to share it across calls; the jobs are then only submitted
+    and their futures returned (each resolves to the saved path).
     """
-    cols = [c for c in df.columns if c.startswith(group_prefix)]
+    if cols is None:
+        cols = df.columns[df.columns.astype(str).str.startswith(group_prefix)]
+    cols = list(cols)
     if not cols:
         print(f"No columns found for prefix {group_prefix}")
-        return
+        return []
+
+    if rename_map is None:
+        rename_map = shorten_axis_labels(cols, group_prefix)
+
+    # Groups come out ordered by weekday, then session number
+    df_groups = df[cols + [hue, weekday_col, session_col]].groupby(
+        [weekday_col, session_col], sort=True, observed=True
+    )
+
+    jobs = []
+    for (wd, ns), df_plot in df_groups:
+        if df_plot.shape[0] < 2:
+            continue
+
+        df_plot = df_plot[cols + [hue]].rename(columns=rename_map)
+        df_plot = df_plot.rename(columns={hue: "Local de trabalho"})
+
+        jobs.append((df_plot, f"{group_prefix} – {weekdays_pt[wd]} (Sessão {ns})"))
+
+    return _render_all(jobs, show, output_dir, executor)
+
+
+def _render(df_plot, title, path=None):
+    """
+    Draw one pairplot; show it interactively, or save it to path and close it.
+    """
+    hue = df_plot["Local de trabalho"]
+    if isinstance(hue.dtype, pd.CategoricalDtype):
+        # Only list work types present in this subset in the legend
+        df_plot = df_plot.assign(**{"Local de trabalho": hue.cat.remove_unused_categories()})
+
+    g = sns.pairplot(
+        df_plot,
+        hue="Local de trabalho",
+        diag_kind="kde"
+    )
+
+    g.fig.set_size_inches(12, 10)
+    g.fig.subplots_adjust(top=0.9)
+    g.fig.suptitle(title, fontsize=14)
+
+    if path is None:
+        plt.show()
+    else:
+        g.savefig(path)
+        plt.close(g.fig)
+    return path
 
-    rename_map = shorten_axis_labels(cols, group_prefix)
 
-    weekdays = sorted(df[weekday_col].dropna().unique())
-    sessions = sorted(df[session_col].dropna().unique())
+def _init_worker():
+    """Use the non-interactive Agg backend in plotting worker processes."""
+    matplotlib.use("Agg")
 
-    for wd in weekdays:
-        for ns in sessions:
-            df_plot = df[
-                (df[weekday_col] == wd) &
-                (df[session_col] == ns)
-            ]
 
-            if df_plot.shape[0] < 2:
-                continue
+def make_render_pool(max_workers=None):
+    """
+    Create a process pool for rendering pairplots to files.
 
-            df_plot = df_plot[cols + [hue]].rename(columns=rename_map)
-            df_plot = df_plot.rename(columns={hue: "Local de trabalho"})
+    Create it once and pass it to every pairplot call, so the workers (and
+    their seaborn/matplotlib imports) are reused across all plots.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker)
 
-            g = sns.pairplot(
-                df_plot,
-                hue="Local de trabalho",
-                diag_kind="kde"
-            )
 
-            g.fig.set_size_inches(12, 10)
-            g.fig.subplots_adjust(top=0.9)
-            g.fig.suptitle(
-                f"{group_prefix} – {weekdays_pt[wd]} (Sessão {ns})",
-                fontsize=14
-            )
+def _render_all(jobs, show, output_dir, executor=None):
+    """
+    Render (df_plot, title) jobs: one by one with plt.show(), or in worker
+    processes writing one PNG per job into output_dir.
 
-            plt.show()
\ No newline at end of file
+    With an executor the jobs are submitted to it and the futures returned;
+    without one a temporary pool renders them before returning.
+    """
+    if show:
+        for df_plot, title in jobs:
+            _render(df_plot, title)
+        return []
+
+    if output_dir is None:
+        raise ValueError("output_dir is required when show=False")
+    os.makedirs(output_dir, exist_ok=True)
+
+    if executor is None:
+        with make_render_pool() as pool:
+            for future in _render_all(jobs, show, output_dir, pool):
+                print(f"Saved {future.result()}")
+        return []
+
+    return [
+        executor.submit(
+            _render,
+            df_plot,
+            title,
+            os.path.join(output_dir, re.sub(r"[^\w.-]+", "_", title).strip("_") + ".png"),
+        )
+        for df_plot, title in jobs
+    ]
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 def shorten_axis_labels(cols, group_prefix):
@@ -29,20 +30,43 @@ def add_session_number(df, date_col="date", session_col="session"):
     Returns
     -------
     pd.DataFrame
-        DataFrame with a new column "n_session" (1, 2, 3, ...).
+        The same DataFrame (modified in place) with parsed date/session
+        columns and a new column "n_session" (1, 2, 3, ...).
     """
-    df = df.copy()
-
-    # Convert date & session to datetime
-    df[date_col] = pd.to_datetime(df[date_col], format="%d-%m-%Y", errors="coerce")
-    df[session_col] = pd.to_datetime(df[session_col], format="%H-%M-%S", errors="coerce").dt.time
-
-    # Create session order per subject and day
-    df["n_session"] = (
-        df.sort_values(session_col)
-          .groupby([ "subject_id", date_col ])
-          .cumcount() + 1
-    )
+    # Convert date & session to datetime (date may already be parsed by add_weekday_pt)
+    dates = df[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format="%d-%m-%Y", errors="coerce", cache=True)
+    session_times = pd.to_datetime(df[session_col], format="%H-%M-%S", errors="coerce", cache=True)
+
+    # Integer sort keys; missing session times sort last, as with sort_values
+    subject_codes = pd.factorize(df["subject_id"])[0]
+    date_values = dates.to_numpy()
+    date_keys = date_values.view("i8")
+    session_values = session_times.to_numpy()
+    session_keys = np.where(np.isnat(session_values), np.iinfo(np.int64).max, session_values.view("i8"))
+
+    # Sort by (subject, date, session) and number rows within each (subject, date) run
+    order = np.lexsort((session_keys, date_keys, subject_codes))
+    sorted_subjects = subject_codes[order]
+    sorted_dates = date_keys[order]
+    run_start = np.ones(len(order), dtype=bool)
+    run_start[1:] = (sorted_subjects[1:] != sorted_subjects[:-1]) | (sorted_dates[1:] != sorted_dates[:-1])
+    start_positions = np.flatnonzero(run_start)
+    position_in_run = np.arange(len(order)) - start_positions[np.cumsum(run_start) - 1] + 1
+
+    n_session = np.empty(len(order), dtype=np.int64)
+    n_session[order] = position_in_run
+
+    # Rows without a subject or date have no session number (like groupby dropna)
+    missing_key = (subject_codes == -1) | np.isnat(date_values)
+    if missing_key.any():
+        n_session = n_session.astype(float)
+        n_session[missing_key] = np.nan
+
+    df[date_col] = dates
+    df[session_col] = session_times.dt.time
+    df["n_session"] = n_session
 
     return df
 
@@ -53,7 +77,8 @@ def add_weekday_pt(df, date_col="date"):
     Parameters
     ----------
     df : pd.DataFrame
-        DataFrame with a date column in "DD-MM-YYYY" format.
+        DataFrame with a date column in "DD-MM-YYYY" format (or already
+        parsed to datetime, in which case it is not parsed again).
     date_col : str, default "date"
         Name of the date column.
 
@@ -63,7 +88,8 @@ def add_weekday_pt(df, date_col="date"):
         DataFrame with a new column "weekday_pt" containing
         weekday names in Portuguese.
     """
-    df[date_col] = pd.to_datetime(df[date_col], format="%d-%m-%Y", errors="coerce")
+    if not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        df[date_col] = pd.to_datetime(df[date_col], format="%d-%m-%Y", errors="coerce", cache=True)
     df["weekday_num"] = df[date_col].dt.weekday
     return df
 
@@ -90,8 +116,18 @@ def autofill_nan_groups(df: pd.DataFrame, min_group_size: int = 2):
     :return: The modified DataFrame with NaNs filled according to the rule above.
     """
 
-    # Select only distribution columns that contain a dot (flattened metric columns)
-    metric_cols = [c for c in df.columns if "." in c and "distributions" in c]
+    # Select only distribution columns that contain a dot (flattened metric columns).
+    # Object columns (e.g. all None) are kept when they coerce to numbers without
+    # losing values; columns holding real non-numeric values are skipped.
+    metric_cols = []
+    for c in df.columns:
+        if "." not in c or "distributions" not in c:
+            continue
+        if not pd.api.types.is_numeric_dtype(df[c]):
+            coerced = pd.to_numeric(df[c], errors="coerce")
+            if coerced.notna().sum() != df[c].notna().sum():
+                continue
+        metric_cols.append(c)
 
     # Group columns by prefix (everything before the last '.')
     groups = {}
@@ -99,15 +135,32 @@ def autofill_nan_groups(df: pd.DataFrame, min_group_size: int = 2):
         prefix = col.rsplit(".", 1)[0]
         groups.setdefault(prefix, []).append(col)
 
-    for prefix, cols in groups.items():
-        if len(cols) < min_group_size:
-            continue  # Ignore groups that are too small
+    # Ignore groups that are too small
+    group_cols = [cols for cols in groups.values() if len(cols) >= min_group_size]
+    if not group_cols:
+        return df
 
-        # Identify rows where at least one column in the group is not NaN
-        mask_any = df[cols].notna().any(axis=1)
+    # Lay all groups out side by side and process them in one pass
+    all_cols = [c for cols in group_cols for c in cols]
+    group_sizes = np.array([len(cols) for cols in group_cols])
+    group_starts = np.concatenate(([0], np.cumsum(group_sizes)[:-1]))
 
-        # Fill NaNs with 0 only for rows where some value exists in the group
-        df.loc[mask_any, cols] = df.loc[mask_any, cols].fillna(0)
+    # Numeric columns keep their dtype; coerced object columns become float64
+    dtypes = {
+        c: dtype if pd.api.types.is_numeric_dtype(dtype) else np.float64
+        for c, dtype in df[all_cols].dtypes.items()
+    }
+    values = df[all_cols].apply(pd.to_numeric).to_numpy(dtype=float, na_value=np.nan, copy=True)
+    is_nan = np.isnan(values)
 
-    return df
+    # (rows x groups): does at least one column in the group have a value?
+    group_has_value = np.logical_or.reduceat(~is_nan, group_starts, axis=1)
 
+    # Fill NaNs with 0 only for rows where some value exists in the group
+    values[is_nan & np.repeat(group_has_value, group_sizes, axis=1)] = 0.0
+
+    # Write back with each column's original dtype (int columns hold no NaN,
+    # so they are never upcast)
+    df[all_cols] = pd.DataFrame(values, index=df.index, columns=all_cols).astype(dtypes)
+
+    return df
@@ -51,6 +51,7 @@ from .path_resolver import (
     expand_wildcards,
     list_keys_at_path,
     find_paths_matching,
+    find_paths_matching_multi,
 )
 
 # Filtering
@@ -92,6 +93,7 @@ __all__ = [
     "expand_wildcards",
     "list_keys_at_path",
     "find_paths_matching",
+    "find_paths_matching_multi",
     # Filtering
     "create_filters",
     "apply_subject_filters",
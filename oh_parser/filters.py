@@ -5,11 +5,19 @@ Functions and data structures for filtering subjects and records.
 """
 from __future__ import annotations
 
+import fnmatch
+import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from .path_resolver import path_exists, resolve_path
-from .utils import is_date_key
+from .path_resolver import path_exists
+from .utils import is_date_key, safe_get
+
+
+# Pre-split path to a subject's group (checked once per subject when filtering by group)
+_GROUP_KEYS = ("meta_data", "group")
 
 
 def create_filters(
@@ -55,34 +63,54 @@ def apply_subject_filters(
     if filters is None:
         return profiles
     
+    # Cheap set-membership checks first; path lookups and user callbacks last
+    subject_ids = filters.get("subject_ids")
+    exclude_subjects = filters.get("exclude_subjects")
+    groups = filters.get("groups")
+    require_keys = filters.get("require_keys")
+    custom_filter = filters.get("custom_filter")
+    
+    if subject_ids is not None:
+        subject_ids = frozenset(subject_ids)
+    if exclude_subjects is not None:
+        exclude_subjects = frozenset(exclude_subjects)
+    if groups is not None:
+        groups = frozenset(groups)
+    
+    # Whitelist only: no per-subject work needed
+    other_filters = (exclude_subjects, groups, require_keys, custom_filter)
+    if subject_ids is not None and all(f is None for f in other_filters):
+        return {sid: profile for sid, profile in profiles.items() if sid in subject_ids}
+    
     result = {}
     
     for subject_id, profile in profiles.items():
         # Check subject_ids whitelist
-        if filters.get("subject_ids") is not None:
-            if subject_id not in filters["subject_ids"]:
-                continue
+        if subject_ids is not None and subject_id not in subject_ids:
+            continue
         
         # Check exclude_subjects blacklist
-        if filters.get("exclude_subjects") is not None:
-            if subject_id in filters["exclude_subjects"]:
-                continue
+        if exclude_subjects is not None and subject_id in exclude_subjects:
+            continue
         
         # Check groups
-        if filters.get("groups") is not None:
-            subject_group = resolve_path(profile, "meta_data.group")
-            if subject_group not in filters["groups"]:
+        if groups is not None:
+            subject_group = safe_get(profile, _GROUP_KEYS)
+            try:
+                in_groups = subject_group in groups
+            except TypeError:  # Unhashable value (e.g. a list) is never a group name
+                in_groups = False
+            if not in_groups:
                 continue
         
         # Check required keys
-        if filters.get("require_keys") is not None:
-            has_all_keys = all(path_exists(profile, key) for key in filters["require_keys"])
-            if not has_all_keys:
+        if require_keys is not None:
+            if not all(path_exists(profile, key) for key in require_keys):
                 continue
         
         # Check custom filter
-        if filters.get("custom_filter") is not None:
-            if not filters["custom_filter"](subject_id, profile):
+        if custom_filter is not None:
+            if not custom_filter(subject_id, profile):
                 continue
         
         result[subject_id] = profile
@@ -90,10 +118,17 @@ def apply_subject_filters(
     return result
 
 
+_DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%Y/%m/%d", "%d/%m/%Y")
+
+
+@lru_cache(maxsize=4096)
 def _parse_date_flexible(date_str: str) -> Optional[datetime]:
     """
     Parse a date string supporting multiple formats.
     
+    Memoized: the same date keys recur for every subject and nesting level,
+    and strptime is slow.
+    
     Supports:
     - YYYY-MM-DD (ISO format)
     - DD-MM-YYYY (EMG data format)
@@ -103,9 +138,7 @@ def _parse_date_flexible(date_str: str) -> Optional[datetime]:
     :param date_str: Date string to parse
     :returns: datetime object or None if parsing fails
     """
-    formats = ["%Y-%m-%d", "%d-%m-%Y", "%Y/%m/%d", "%d/%m/%Y"]
-    
-    for fmt in formats:
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -169,8 +202,24 @@ def matches_pattern(key: str, patterns: List[str]) -> bool:
     :param patterns: List of patterns.
     :returns: True if key matches any pattern.
     """
-    import fnmatch
-    return any(fnmatch.fnmatch(key, p) for p in patterns)
+    match = _compile_patterns(tuple(patterns))
+    return match is not None and match(os.path.normcase(key)) is not None
+
+
+@lru_cache(maxsize=256)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Optional[Callable[[str], Any]]:
+    """
+    Compile glob patterns into a single regex match function.
+    
+    Patterns are case-normalized like fnmatch.fnmatch (case-insensitive on Windows).
+    
+    :param patterns: Tuple of glob patterns.
+    :returns: Compiled regex .match method, or None if there are no patterns.
+    """
+    if not patterns:
+        return None
+    regex = "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+    return re.compile(regex).match
 
 
 def exclude_keys(keys: List[str], exclude_patterns: List[str]) -> List[str]:
@@ -181,7 +230,10 @@ def exclude_keys(keys: List[str], exclude_patterns: List[str]) -> List[str]:
     :param exclude_patterns: Patterns to exclude (supports wildcards).
     :returns: Keys not matching any exclusion pattern.
     """
-    return [k for k in keys if not matches_pattern(k, exclude_patterns)]
+    match = _compile_patterns(tuple(exclude_patterns))
+    if match is None:
+        return list(keys)
+    return [k for k in keys if match(os.path.normcase(k)) is None]
 
 
 def include_keys(keys: List[str], include_patterns: List[str]) -> List[str]:
@@ -192,4 +244,7 @@ def include_keys(keys: List[str], include_patterns: List[str]) -> List[str]:
     :param include_patterns: Patterns to include (supports wildcards).
     :returns: Keys matching at least one inclusion pattern.
     """
-    return [k for k in keys if matches_pattern(k, include_patterns)]
+    match = _compile_patterns(tuple(include_patterns))
+    if match is None:
+        return []
+    return [k for k in keys if match(os.path.normcase(k)) is not None]
@@ -6,13 +6,24 @@ Functions to discover and load OH profile JSON files.
 from __future__ import annotations
 
 import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional dependency: fall back to the stdlib parser
+    orjson = None
 
 
 # Standard OH profile filename suffix
 _OH_PROFILE_SUFFIX = "_OH_profile.json"
 
+# Binary sidecar holding already-parsed profiles (see load_profiles use_cache)
+_CACHE_FILENAME = ".oh_profiles_cache.pkl"
+
 
 # =============================================================================
 # PUBLIC FUNCTIONS
@@ -22,13 +33,28 @@ def load_profiles(
     directory: Union[str, Path],
     subject_ids: Optional[List[str]] = None,
     verbose: bool = True,
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+    use_cache: bool = False,
 ) -> Dict[str, dict]:
     """
     Load all OH profiles from a directory.
     
+    Files are read concurrently. Threads are used by default, which overlaps
+    file I/O; set use_processes=True to also parallelize JSON parsing across
+    CPU cores (worthwhile for many large profiles).
+    
+    With use_cache=True, parsed profiles are also stored in a pickle sidecar
+    (".oh_profiles_cache.pkl") in the profiles directory. On later runs, any
+    profile whose file modification time and size are unchanged is read from
+    the sidecar instead of being re-parsed.
+    
     :param directory: Path to directory containing OH profiles.
     :param subject_ids: Optional list of specific subject IDs to load (None = all).
     :param verbose: If True, print loading progress.
+    :param max_workers: Number of parallel workers (None = os.cpu_count(), 1 = serial).
+    :param use_processes: If True, use a process pool instead of a thread pool.
+    :param use_cache: If True, reuse/update the pickle sidecar cache.
     :returns: Dictionary mapping subject_id -> profile dict.
     :raises FileNotFoundError: If directory doesn't exist.
     """
@@ -40,22 +66,68 @@ def load_profiles(
             print(f"[oh_parser] No OH profiles found in {dir_path}")
         return {}
     
-    profiles: Dict[str, dict] = {}
-    errors: List[str] = []
-    
+    # Filter by subject_ids if specified
+    selected = {}
     for path in profile_paths:
         subject_id = _extract_subject_id(path)
+        if subject_ids is None or subject_id in subject_ids:
+            selected[subject_id] = path
+    
+    loaded: Dict[str, dict] = {}
+    errors: List[str] = []
+    
+    # Reuse cached profiles whose source file is unchanged
+    cache_path = dir_path / _CACHE_FILENAME
+    cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+    file_keys: Dict[str, Tuple[int, int]] = {}
+    to_parse = selected
+    if use_cache:
+        cache = _read_cache(cache_path)
+        to_parse = {}
+        for subject_id, path in selected.items():
+            file_keys[subject_id] = _file_key(path)
+            entry = cache.get(subject_id)
+            if entry is not None and entry[0] == file_keys[subject_id]:
+                loaded[subject_id] = entry[1]
+            else:
+                to_parse[subject_id] = path
+    
+    if to_parse:
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(to_parse)))
         
-        # Filter by subject_ids if specified
-        if subject_ids is not None and subject_id not in subject_ids:
-            continue
+        executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_cls(max_workers=max_workers) as executor:
+            futures = {
+                subject_id: executor.submit(load_profile, path)
+                for subject_id, path in to_parse.items()
+            }
+            
+            for subject_id, future in futures.items():
+                try:
+                    loaded[subject_id] = future.result()
+                except json.JSONDecodeError as e: # Catch JSON decode errors
+                    errors.append(f"{subject_id}: JSON decode error - {e}")
+                except Exception as e: # Catch all other exceptions
+                    errors.append(f"{subject_id}: {e}")
         
-        try:
-            profiles[subject_id] = load_profile(path)
-        except json.JSONDecodeError as e: # Catch JSON decode errors
-            errors.append(f"{subject_id}: JSON decode error - {e}")
-        except Exception as e: # Catch all other exceptions
-            errors.append(f"{subject_id}: {e}")
+        if use_cache:
+            discovered = {_extract_subject_id(p) for p in profile_paths}
+            cache = {sid: entry for sid, entry in cache.items() if sid in discovered}
+            for subject_id in to_parse:
+                if subject_id in loaded:
+                    cache[subject_id] = (file_keys[subject_id], loaded[subject_id])
+            try:
+                _write_cache(cache_path, cache)
+            except OSError as e:
+                if verbose:
+                    print(f"[oh_parser] Could not write profile cache {cache_path}: {e}")
+    
+    # Keep discovery order so the result is deterministic
+    profiles: Dict[str, dict] = {
+        subject_id: loaded[subject_id] for subject_id in selected if subject_id in loaded
+    }
     
     if verbose:
         print(f"[oh_parser] Loaded {len(profiles)} OH profiles from {dir_path}")
@@ -73,6 +145,10 @@ def load_profile(filepath: Union[str, Path]) -> dict:
     """
     Load a single OH profile JSON file.
     
+    Uses orjson when installed (several times faster on large profiles),
+    otherwise the standard library json module. Files orjson rejects (e.g.
+    NaN/Infinity literals written by Python's json) are re-parsed with json.
+    
     :param filepath: Path to OH profile JSON file.
     :returns: Parsed JSON as dictionary.
     :raises FileNotFoundError: If file doesn't exist.
@@ -83,6 +159,12 @@ def load_profile(filepath: Union[str, Path]) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"OH profile not found: {path}")
     
+    if orjson is not None:
+        try:
+            return orjson.loads(path.read_bytes())
+        except orjson.JSONDecodeError:
+            pass  # Let json handle NaN/Infinity or report the error
+    
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -164,3 +246,45 @@ def _extract_subject_id(filepath: Path) -> str:
     if filename.endswith(_OH_PROFILE_SUFFIX):
         return filename[:-len(_OH_PROFILE_SUFFIX)]  # Remove the suffix to get subject_id
     return filepath.stem
+
+
+def _file_key(filepath: Path) -> Tuple[int, int]:
+    """
+    Build the cache validity key for a profile file.
+    
+    :param filepath: Path to OH profile file.
+    :returns: (modification time in ns, size in bytes).
+    """
+    stat = filepath.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_cache(cache_path: Path) -> Dict[str, Any]:
+    """
+    Read the profile cache sidecar.
+    
+    :param cache_path: Path to the cache file.
+    :returns: Mapping subject_id -> (file_key, profile), or {} if missing/unreadable.
+    """
+    if not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path, "rb") as f:
+            cache = pickle.load(f)
+    except Exception: # Corrupt or incompatible cache - rebuild it
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(cache_path: Path, cache: Dict[str, Any]) -> None:
+    """
+    Atomically write the profile cache sidecar.
+    
+    :param cache_path: Path to the cache file.
+    :param cache: Mapping subject_id -> (file_key, profile).
+    :raises OSError: If the file cannot be written.
+    """
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
@@ -6,12 +6,26 @@ Functions to navigate nested dictionaries using dot-notation paths with wildcard
 from __future__ import annotations
 
 import fnmatch
+import os
 import re
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Final, Generator, List, Optional, Sequence, Tuple, Union
 
 from .utils import safe_get, is_date_key, is_time_key
 
 
+_SIDE_PATTERNS: Final[frozenset[str]] = frozenset(
+    {"left", "right", "Left", "Right", "LEFT", "RIGHT", "L", "R"}
+)
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dot-notation path into a tuple of keys (memoized)."""
+    return tuple(path.split("."))
+
+
 def resolve_path(data: dict, path: str, default: Any = None) -> Any:
     """
     Get value from nested dict using dot-notation path.
@@ -29,8 +43,27 @@ def resolve_path(data: dict, path: str, default: Any = None) -> Any:
     if not path:
         return data
     
-    keys = path.split(".")
-    return safe_get(data, keys, default)
+    return safe_get(data, _split_path(path), default)
+
+
+@lru_cache(maxsize=256)
+def _compile_wildcard_path(
+    path: str,
+    level_names: Tuple[str, ...],
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Pre-process a wildcard path once: split it and name every "*" level.
+    
+    :param path: Dot-notation path with wildcards.
+    :param level_names: Names for the wildcard levels, in order.
+    :returns: (path parts, one context name per wildcard).
+    """
+    parts = _split_path(path)
+    names = tuple(
+        level_names[i] if i < len(level_names) else f"level_{i}"
+        for i in range(parts.count("*"))
+    )
+    return parts, names
 
 
 def path_exists(data: dict, path: str) -> bool:
@@ -41,8 +74,15 @@ def path_exists(data: dict, path: str) -> bool:
     :param path: Dot-notation path to check.
     :returns: True if path exists.
     """
-    sentinel = object()
-    return resolve_path(data, path, default=sentinel) is not sentinel
+    if not path:
+        return True
+    
+    node = data
+    for key in _split_path(path):
+        if not isinstance(node, dict) or key not in node:
+            return False
+        node = node[key]
+    return True
 
 
 def expand_wildcards(
@@ -67,33 +107,28 @@ def expand_wildcards(
         >>> list(expand_wildcards(d, "emg.*.*.left", ["date", "session"]))
         [({'date': '2025-01-01', 'session': '10-00-00'}, 1)]
     """
-    parts = path.split(".")
-    level_names = level_names or []
+    parts, names = _compile_wildcard_path(path, tuple(level_names or ()))
+    n_parts = len(parts)
     
-    def _expand(current: Any, parts_remaining: List[str], context: Dict[str, str], wildcard_idx: int):
-        if not parts_remaining:
-            yield context.copy(), current
-            return
-        
-        part = parts_remaining[0]
-        rest = parts_remaining[1:]
-        
-        if not isinstance(current, dict):
-            return
+    # Explicit DFS stack of (node, part index, keys matched by wildcards so far)
+    stack = [(data, 0, ())]
+    while stack:
+        current, idx, matched = stack.pop()
         
-        if part == "*":
-            # Match any key at this level
-            level_name = level_names[wildcard_idx] if wildcard_idx < len(level_names) else f"level_{wildcard_idx}"
-            for key, value in current.items():
-                new_context = context.copy()
-                new_context[level_name] = key
-                yield from _expand(value, rest, new_context, wildcard_idx + 1)
+        # Advance through exact-match parts without pushing frames
+        while idx < n_parts and parts[idx] != "*":
+            if not isinstance(current, dict) or parts[idx] not in current:
+                break
+            current = current[parts[idx]]
+            idx += 1
         else:
-            # Exact match
-            if part in current:
-                yield from _expand(current[part], rest, context, wildcard_idx)
-    
-    yield from _expand(data, parts, {}, 0)
+            if idx == n_parts:
+                yield dict(zip(names, matched)), current
+            elif isinstance(current, dict):
+                # Wildcard: push children in reverse so they pop in key order
+                idx += 1
+                for key, value in reversed(current.items()):
+                    stack.append((value, idx, matched + (key,)))
 
 
 def list_keys_at_path(data: dict, path: str) -> List[str]:
@@ -127,7 +162,7 @@ def get_structure_summary(
     :param data: Nested dictionary.
     :param path: Starting path.
     :param max_depth: Maximum depth to traverse.
-    :param _current_depth: Internal depth counter.
+    :param _current_depth: Depth of the starting node (internal).
     :returns: Structure summary dict.
     """
     target = resolve_path(data, path) if path else data
@@ -138,38 +173,97 @@ def get_structure_summary(
     if _current_depth >= max_depth:
         return {"_type": "dict", "_keys": list(target.keys())[:5], "_truncated": True}
     
-    result = {}
-    for key, value in target.items():
-        if isinstance(value, dict):
-            result[key] = get_structure_summary(
-                value, 
-                path="",
-                max_depth=max_depth,
-                _current_depth=_current_depth + 1,
-            )
-        else:
-            result[key] = {"_type": type(value).__name__}
+    # Breadth-first over (summary dict to fill, source dict, depth)
+    result: Dict[str, Any] = {}
+    queue = deque([(result, target, _current_depth)])
+    while queue:
+        summary, node, depth = queue.popleft()
+        for key, value in node.items():
+            if not isinstance(value, dict):
+                summary[key] = {"_type": type(value).__name__}
+            elif depth + 1 >= max_depth:
+                summary[key] = {"_type": "dict", "_keys": list(value.keys())[:5], "_truncated": True}
+            else:
+                summary[key] = {}
+                queue.append((summary[key], value, depth + 1))
     
     return result
 
 
 def find_paths_matching(
     data: dict,
-    pattern: str,
+    pattern: Union[str, Sequence[str]],
     max_depth: int = 10,
 ) -> List[str]:
     """
     Find all paths in nested dict matching a glob pattern.
     
     :param data: Nested dictionary.
-    :param pattern: Glob pattern (e.g., "*.emg.*" or "sensor_metrics.*.EMG_*").
+    :param pattern: Glob pattern (e.g., "*.emg.*" or "sensor_metrics.*.EMG_*"),
+        or a list of patterns (see find_paths_matching_multi).
     :param max_depth: Maximum depth to search.
     :returns: List of matching paths.
     """
     from .utils import get_nested_keys
     
+    if not isinstance(pattern, str):
+        return find_paths_matching_multi(data, pattern, max_depth=max_depth)
+    
     all_paths = get_nested_keys(data, max_depth=max_depth)
-    return [p for p in all_paths if fnmatch.fnmatch(p, pattern)]
+    
+    # Case-normalized like fnmatch.fnmatch (case-insensitive on Windows)
+    normcase = os.path.normcase
+    pattern = normcase(pattern)
+    
+    if not _has_glob_chars(pattern):
+        # Literal path
+        return [p for p in all_paths if normcase(p) == pattern]
+    
+    if pattern.endswith(".*") and not _has_glob_chars(pattern[:-2]):
+        # "prefix.*" matches everything below prefix
+        prefix = pattern[:-1]
+        return [p for p in all_paths if normcase(p).startswith(prefix)]
+    
+    match = re.compile(fnmatch.translate(pattern)).match
+    return [p for p in all_paths if match(normcase(p))]
+
+
+def find_paths_matching_multi(
+    data: dict,
+    patterns: Sequence[str],
+    max_depth: int = 10,
+) -> List[str]:
+    """
+    Find all paths in nested dict matching any of several glob patterns.
+    
+    The patterns are combined into a single regex, so every path is
+    scanned once regardless of how many patterns are given.
+    
+    :param data: Nested dictionary.
+    :param patterns: Glob patterns (e.g., ["*.emg.*", "*.heart_rate.*"]).
+    :param max_depth: Maximum depth to search.
+    :returns: List of paths matching at least one pattern.
+    """
+    from .utils import get_nested_keys
+    
+    if not patterns:
+        return []
+    
+    match = _compile_globs(tuple(patterns))
+    normcase = os.path.normcase
+    return [p for p in get_nested_keys(data, max_depth=max_depth) if match(normcase(p))]
+
+
+@lru_cache(maxsize=128)
+def _compile_globs(patterns: Tuple[str, ...]):
+    """Compile glob patterns into one case-normalized regex .match method."""
+    regex = "|".join(f"(?:{fnmatch.translate(os.path.normcase(p))})" for p in patterns)
+    return re.compile(regex).match
+
+
+def _has_glob_chars(pattern: str) -> bool:
+    """Check whether a pattern contains fnmatch metacharacters."""
+    return "*" in pattern or "?" in pattern or "[" in pattern
 
 
 def infer_level_type(keys: List[str]) -> str:
@@ -182,17 +276,20 @@ def infer_level_type(keys: List[str]) -> str:
     if not keys:
         return "empty"
     
-    # Check if all are dates
-    if all(is_date_key(k) for k in keys):
-        return "date"
+    # Single pass: drop each candidate type on its first counterexample
+    could_date = could_time = could_side = True
+    for k in keys:
+        if could_date and not is_date_key(k):
+            could_date = False
+        if could_time and not is_time_key(k):
+            could_time = False
+        if could_side and k not in _SIDE_PATTERNS:
+            could_side = False
+        if not (could_date or could_time or could_side):
+            return "generic"
     
-    # Check if all are times
-    if all(is_time_key(k) for k in keys):
+    if could_date:
+        return "date"
+    if could_time:
         return "time"
-    
-    # Check if side labels
-    side_patterns = {"left", "right", "Left", "Right", "LEFT", "RIGHT", "L", "R"}
-    if all(k in side_patterns for k in keys):
-        return "side"
-    
-    return "generic"
+    return "side"
@@ -5,15 +5,16 @@ Helper functions for dictionary manipulation and DataFrame operations.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
 
 
-def safe_get(data: dict, keys: List[str], default: Any = None) -> Any:
+def safe_get(data: dict, keys: Sequence[str], default: Any = None) -> Any:
     """
-    Safely navigate nested dictionary using a list of keys.
+    Safely navigate nested dictionary using a sequence of keys.
     
     :param data: Nested dictionary to navigate.
-    :param keys: List of keys to traverse.
+    :param keys: List or tuple of keys to traverse.
     :param default: Value to return if path doesn't exist.
     :returns: Value at path or default.
     
@@ -174,6 +175,7 @@ def print_tree(
                 print("  " * indent + f"├── {key} ({type_name})")
 
 
+@lru_cache(maxsize=4096)
 def is_date_key(key: str) -> bool:
     """
     Check if a key looks like a date (YYYY-MM-DD or DD-MM-YYYY format).
@@ -202,6 +204,7 @@ def is_date_key(key: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=4096)
 def is_time_key(key: str) -> bool:
     """
     Check if a key looks like a time (HH-MM-SS format).
@@ -161,6 +161,7 @@ from .report import (
     coefficient_table_multiple,
     results_summary,
     export_to_csv,
+    export_to_parquet,
     export_to_latex,
     print_results_summary,
     print_coefficient_summary,
@@ -277,6 +278,7 @@ __all__ = [
     "coefficient_table_multiple",
     "results_summary",
     "export_to_csv",
+    "export_to_parquet",
     "export_to_latex",
     "print_results_summary",
     "print_coefficient_summary",
@@ -62,7 +62,7 @@ def summarize_outcomes(
     if by_group and ds["grouping_vars"]:
         # Compute within groups
         results = []
-        for group_vals, group_df in ds["data"].groupby(ds["grouping_vars"]):
+        for group_vals, group_df in ds["data"].groupby(ds["grouping_vars"], observed=True):
             if not isinstance(group_vals, tuple):
                 group_vals = (group_vals,)
             
@@ -410,7 +410,7 @@ def missingness_report(
     # Missingness by subject
     from .prepare import get_obs_per_subject
     
-    subject_missing = df.groupby(ds["id_var"])[outcomes].apply(
+    subject_missing = df.groupby(ds["id_var"], observed=True)[outcomes].apply(
         lambda x: x.isna().sum().sum()
     ).rename("total_missing")
     
@@ -23,6 +23,7 @@ import warnings
 import numpy as np
 import pandas as pd
 from scipy import stats
+from statsmodels.stats.multitest import multipletests
 
 from .lmm import LMMResult
 
@@ -33,6 +34,14 @@ from .lmm import LMMResult
 
 CorrectionMethod = Literal["bonferroni", "holm", "fdr_bh", "fdr_by", "none"]
 
+# Our method names -> statsmodels.stats.multitest.multipletests method names
+_MULTIPLETESTS_METHODS = {
+    "bonferroni": "bonferroni",
+    "holm": "holm",
+    "fdr_bh": "fdr_bh",
+    "fdr_by": "fdr_by",
+}
+
 
 def adjust_pvalues(
     pvalues: Union[np.ndarray, List[float]],
@@ -49,7 +58,7 @@ def adjust_pvalues(
         - "fdr_bh": Benjamini-Hochberg (FDR control, recommended default)
         - "fdr_by": Benjamini-Yekutieli (FDR under dependence)
         - "none": No adjustment
-    :param alpha: Significance level (for reference, not used in adjustment)
+    :param alpha: Significance level (passed to multipletests; does not affect adjusted values)
     :returns: Array of adjusted p-values
     
     References:
@@ -65,28 +74,23 @@ def adjust_pvalues(
     if method == "none":
         return pvalues.copy()
     
-    # Handle NaN values
+    # Handle NaN values (NaN-free input skips masking and reconstruction)
     nan_mask = np.isnan(pvalues)
-    valid_pvalues = pvalues[~nan_mask]
-    n_valid = len(valid_pvalues)
+    has_nan = nan_mask.any()
+    valid_pvalues = pvalues[~nan_mask] if has_nan else pvalues
     
-    if n_valid == 0:
+    if len(valid_pvalues) == 0:
         return pvalues.copy()
     
-    if method == "bonferroni":
-        adjusted_valid = np.minimum(valid_pvalues * n_valid, 1.0)
-    
-    elif method == "holm":
-        adjusted_valid = _holm_correction(valid_pvalues)
+    if method not in _MULTIPLETESTS_METHODS:
+        raise ValueError(f"Unknown method: {method}")
     
-    elif method == "fdr_bh":
-        adjusted_valid = _bh_correction(valid_pvalues)
+    adjusted_valid = multipletests(
+        valid_pvalues, alpha=alpha, method=_MULTIPLETESTS_METHODS[method]
+    )[1]
     
-    elif method == "fdr_by":
-        adjusted_valid = _by_correction(valid_pvalues)
-    
-    else:
-        raise ValueError(f"Unknown method: {method}")
+    if not has_nan:
+        return adjusted_valid
     
     # Reconstruct with NaN
     adjusted = np.full(n, np.nan)
@@ -95,88 +99,6 @@ def adjust_pvalues(
     return adjusted
 
 
-def _holm_correction(pvalues: np.ndarray) -> np.ndarray:
-    """
-    Holm step-down procedure for FWER control.
-    
-    More powerful than Bonferroni while still controlling FWER.
-    """
-    n = len(pvalues)
-    sorted_idx = np.argsort(pvalues)
-    sorted_pvals = pvalues[sorted_idx]
-    
-    # Holm adjustment: p_adj[i] = max(p[j] * (n - j)) for j <= i
-    adjusted_sorted = np.zeros(n)
-    cummax = 0
-    
-    for i in range(n):
-        adj = sorted_pvals[i] * (n - i)
-        cummax = max(cummax, adj)
-        adjusted_sorted[i] = min(cummax, 1.0)
-    
-    # Restore original order
-    adjusted = np.zeros(n)
-    adjusted[sorted_idx] = adjusted_sorted
-    
-    return adjusted
-
-
-def _bh_correction(pvalues: np.ndarray) -> np.ndarray:
-    """
-    Benjamini-Hochberg procedure for FDR control.
-    
-    Controls the expected proportion of false discoveries.
-    """
-    n = len(pvalues)
-    sorted_idx = np.argsort(pvalues)
-    sorted_pvals = pvalues[sorted_idx]
-    
-    # BH adjustment: p_adj[i] = min(p[j] * n / (j+1)) for j >= i
-    adjusted_sorted = np.zeros(n)
-    cummin = 1.0
-    
-    for i in range(n - 1, -1, -1):
-        adj = sorted_pvals[i] * n / (i + 1)
-        cummin = min(cummin, adj)
-        adjusted_sorted[i] = min(cummin, 1.0)
-    
-    # Restore original order
-    adjusted = np.zeros(n)
-    adjusted[sorted_idx] = adjusted_sorted
-    
-    return adjusted
-
-
-def _by_correction(pvalues: np.ndarray) -> np.ndarray:
-    """
-    Benjamini-Yekutieli procedure for FDR under dependence.
-    
-    More conservative than BH, but valid under arbitrary dependence.
-    """
-    n = len(pvalues)
-    
-    # Correction factor: sum(1/i) for i=1 to n
-    c_n = np.sum(1.0 / np.arange(1, n + 1))
-    
-    sorted_idx = np.argsort(pvalues)
-    sorted_pvals = pvalues[sorted_idx]
-    
-    # BY adjustment: same as BH but multiply by c(n)
-    adjusted_sorted = np.zeros(n)
-    cummin = 1.0
-    
-    for i in range(n - 1, -1, -1):
-        adj = sorted_pvals[i] * n * c_n / (i + 1)
-        cummin = min(cummin, adj)
-        adjusted_sorted[i] = min(cummin, 1.0)
-    
-    # Restore original order
-    adjusted = np.zeros(n)
-    adjusted[sorted_idx] = adjusted_sorted
-    
-    return adjusted
-
-
 # =============================================================================
 # Outcome-level FDR (across multiple outcomes)
 # =============================================================================
@@ -209,17 +131,35 @@ def apply_fdr(
     else:
         results_list = results
     
+    fitted = [
+        (i, result) for i, result in enumerate(results_list)
+        if not result["coefficients"].empty
+    ]
+    if not fitted:
+        return pd.DataFrame()
+    
+    # Stack all coefficient tables once, tagged with their result position
+    all_coefs = pd.concat(
+        [result["coefficients"] for _, result in fitted],
+        keys=[i for i, _ in fitted],
+        names=["result", None],
+    ).reset_index(level="result").reset_index(drop=True)
+    
+    # Find the term (partial match for categorical encoding)
+    term_mask = all_coefs["term"].str.contains(term, case=False, na=False, regex=False)
+    term_rows = all_coefs[term_mask]
+    
+    # For categorical factors, take the most significant p-value
+    # (representing the overall factor effect)
+    best_idx = term_rows.groupby("result", sort=False)["p_value"].idxmin()
+    best_rows = term_rows.loc[best_idx].set_index("result").to_dict("index")
+    
     rows = []
     
-    for result in results_list:
-        if result["coefficients"].empty:
-            continue
-        
-        # Find the term (partial match for categorical encoding)
-        term_mask = result["coefficients"]["term"].str.contains(term, case=False, na=False)
-        term_rows = result["coefficients"][term_mask]
+    for i, result in fitted:
+        best_row = best_rows.get(i)
         
-        if term_rows.empty:
+        if best_row is None:
             # Term not found - might be reference level
             rows.append({
                 "outcome": result["outcome"],
@@ -230,11 +170,6 @@ def apply_fdr(
             })
             continue
         
-        # For categorical factors, take the most significant p-value
-        # (representing the overall factor effect)
-        min_p_idx = term_rows["p_value"].idxmin()
-        best_row = term_rows.loc[min_p_idx]
-        
         rows.append({
             "outcome": result["outcome"],
             "term": best_row["term"],
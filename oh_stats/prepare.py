@@ -33,6 +33,9 @@ import numpy as np
 # Date Parsing
 # =============================================================================
 
+_DATE_FORMATS = ("%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y", "%Y/%m/%d")
+
+
 def parse_date(date_str: str) -> Optional[pd.Timestamp]:
     """
     Parse date strings in multiple formats.
@@ -44,9 +47,7 @@ def parse_date(date_str: str) -> Optional[pd.Timestamp]:
     :param date_str: Date string to parse
     :returns: pandas Timestamp or None if parsing fails
     """
-    formats = ["%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y", "%Y/%m/%d"]
-    
-    for fmt in formats:
+    for fmt in _DATE_FORMATS:
         try:
             return pd.to_datetime(date_str, format=fmt)
         except (ValueError, TypeError):
@@ -59,9 +60,27 @@ def parse_date(date_str: str) -> Optional[pd.Timestamp]:
         return None
 
 
+# Per-element inference for the last pass; format="mixed" needs pandas >= 2.0,
+# older versions infer per element with format=None
+_INFER_FORMAT = "mixed" if int(pd.__version__.split(".")[0]) >= 2 else None
+
+
 def _parse_date_column(series: pd.Series) -> pd.Series:
-    """Parse a series of date strings to datetime."""
-    return series.apply(parse_date)
+    """
+    Parse a series of date strings to datetime.
+    
+    Vectorized equivalent of applying parse_date: each format is tried on
+    the whole series, then only still-unparsed values move to the next one.
+    """
+    out = pd.to_datetime(series, format=_DATE_FORMATS[0], errors="coerce", cache=True)
+    
+    for fmt in _DATE_FORMATS[1:] + (_INFER_FORMAT,):
+        mask = out.isna() & series.notna()
+        if not mask.any():
+            break
+        out.loc[mask] = pd.to_datetime(series[mask], format=fmt, errors="coerce", cache=True)
+    
+    return out
 
 
 # =============================================================================
@@ -172,7 +191,7 @@ def get_date_range(ds: AnalysisDataset) -> Tuple[Any, Any]:
 
 def get_obs_per_subject(ds: AnalysisDataset) -> pd.Series:
     """Get number of observations per subject."""
-    return ds["data"].groupby(ds["id_var"]).size()
+    return ds["data"].groupby(ds["id_var"], observed=True).size()
 
 
 def subset_dataset(
@@ -324,6 +343,9 @@ def prepare_from_dataframe(
         if len(df) < n_before:
             warnings.warn(f"Dropped {n_before - len(df)} rows with unparseable dates")
     
+    # Categorical subject IDs: sorts and groupbys work on integer codes
+    df[id_col] = df[id_col].astype("category")
+    
     # Handle sides if present
     grouping_vars: List[str] = []
     if "side" in df.columns:
@@ -343,12 +365,12 @@ def prepare_from_dataframe(
         sort_cols.append("date")
     if "side" in df.columns:
         sort_cols.append("side")
-    df = df.sort_values(sort_cols).reset_index(drop=True)
+    df = df.sort_values(sort_cols, kind="stable").reset_index(drop=True)
     
     # Identify outcome columns
-    meta_cols = {id_col, "date", "side", "day_index", "weekday"}
+    meta_cols = [id_col, "date", "side", "day_index", "weekday"]
     if outcome_cols is None:
-        outcome_vars = [c for c in df.columns if c not in meta_cols]
+        outcome_vars = df.columns.difference(meta_cols, sort=False).tolist()
     else:
         # Validate provided outcome columns exist
         missing = [c for c in outcome_cols if c not in df.columns]
@@ -567,14 +589,10 @@ def _handle_sides(
         return df, []
     
     if side == "left":
-        df = df[df["side"] == "left"].copy()
-        df = df.drop(columns=["side"])
-        return df, []
+        return df.loc[df["side"] == "left"].drop(columns=["side"]), []
     
     elif side == "right":
-        df = df[df["side"] == "right"].copy()
-        df = df.drop(columns=["side"])
-        return df, []
+        return df.loc[df["side"] == "right"].drop(columns=["side"]), []
     
     elif side == "both":
         return df, ["side"]
@@ -583,30 +601,31 @@ def _handle_sides(
         # Average across sides only when both exist
         meta_cols = ["subject_id", "date"]
         
-        # Check which subject×date combinations have both sides
-        side_counts = df.groupby(["subject_id", "date"])["side"].nunique()
-        has_both = side_counts[side_counts == 2].index
-        has_one = side_counts[side_counts == 1].index
+        # Number of distinct sides per subject×date, broadcast to each row
+        n_sides = df.groupby(meta_cols, observed=True)["side"].transform("nunique")
+        both_mask = n_sides == 2
         
-        if len(has_both) == 0:
+        if not both_mask.any():
             warnings.warn("No subject×date combinations have both sides. Returning all data.")
             return df, ["side"]
         
         # Filter to only rows with both sides
-        df_both = df.set_index(["subject_id", "date"])
-        df_both = df_both.loc[df_both.index.isin(has_both)].reset_index()
+        df_both = df[both_mask]
         
         # Identify numeric columns for averaging
-        numeric_cols = df_both.select_dtypes(include=[np.number]).columns.tolist()
-        numeric_cols = [c for c in numeric_cols if c not in meta_cols]
+        numeric_cols = [
+            c for c in df.select_dtypes(include=[np.number]).columns
+            if c not in meta_cols
+        ]
         
         # Group and average
-        df_avg = df_both.groupby(meta_cols)[numeric_cols].mean().reset_index()
+        df_avg = df_both.groupby(meta_cols, observed=True)[numeric_cols].mean().reset_index()
         
         # Report data loss in detail
+        one_side = df.loc[n_sides == 1, meta_cols]
         n_rows_dropped = len(df) - len(df_both)
-        n_subjects_affected = df.loc[df.set_index(["subject_id", "date"]).index.isin(has_one)]["subject_id"].nunique()
-        n_obs_lost = len(has_one)  # Number of subject×date combinations lost
+        n_subjects_affected = one_side["subject_id"].nunique()
+        n_obs_lost = len(one_side.drop_duplicates())  # Number of subject×date combinations lost
         
         if n_rows_dropped > 0:
             warnings.warn(
@@ -628,21 +647,14 @@ def _add_day_index(df: pd.DataFrame) -> pd.DataFrame:
     
     Days are ordered chronologically within each subject.
     """
-    df = df.copy()
-    
-    # Compute day_index per subject using transform instead of apply
-    # This avoids the FutureWarning about grouping columns
     df = df.sort_values(["subject_id", "date"])
     
-    # Create a mapping of date to day index within each subject
-    day_indices = []
-    for _, group in df.groupby("subject_id", sort=False):
-        unique_dates = group["date"].unique()
-        date_to_idx = {d: i + 1 for i, d in enumerate(sorted(unique_dates))}
-        day_indices.extend(group["date"].map(date_to_idx).tolist())
-    
-    df["day_index"] = day_indices
-    df["day_index"] = df["day_index"].astype(int)
+    # Dense rank of dates within each subject: 1, 2, 3, ...
+    df["day_index"] = (
+        df.groupby("subject_id", sort=False, observed=True)["date"]
+        .rank(method="dense")
+        .astype(np.int32)
+    )
     
     return df
 
@@ -672,17 +684,14 @@ def prepare_daily_questionnaires(
     from oh_parser import extract_nested
     
     # Check if any profile has questionnaire data
-    has_data = False
-    for profile in profiles.values():
-        dq = profile.get("daily_questionnaires", {})
-        if domain:
-            if dq.get(domain):
-                has_data = True
-                break
-        else:
-            if any(bool(v) for v in dq.values() if isinstance(v, dict)):
-                has_data = True
-                break
+    # Lazy per-profile lookup so any() stops at the first profile with data
+    questionnaires = (profile.get("daily_questionnaires") or {} for profile in profiles.values())
+    if domain:
+        has_data = any(dq.get(domain) for dq in questionnaires)
+    else:
+        has_data = any(
+            v for dq in questionnaires for v in dq.values() if isinstance(v, dict)
+        )
     
     if not has_data:
         # Conditionally deactivated - no data available
@@ -712,6 +721,11 @@ def prepare_daily_questionnaires(
     if df.empty:
         return None
     
+    # Categorical keys: compact, and grouped on integer codes downstream
+    df["subject_id"] = df["subject_id"].astype("category")
+    if "domain" in df.columns:
+        df["domain"] = df["domain"].astype("category")
+    
     # Add day index
     if add_day_index:
         df = _add_day_index(df)
@@ -721,8 +735,8 @@ def prepare_daily_questionnaires(
         df["weekday"] = df["date"].dt.day_name()
     
     # Identify outcome columns
-    meta_cols = {"subject_id", "date", "domain", "day_index", "weekday"}
-    outcome_vars = [c for c in df.columns if c not in meta_cols]
+    meta_cols = ["subject_id", "date", "domain", "day_index", "weekday"]
+    outcome_vars = df.columns.difference(meta_cols, sort=False).tolist()
     
     grouping_vars = ["domain"] if "domain" in df.columns else []
     
@@ -771,37 +785,38 @@ def prepare_weekly_emg(
     # Reshape from wide to long (one row per side)
     # Current: columns like "left.EMG_apdf.active.p50", "right.EMG_apdf.active.p50"
     
-    left_cols = [c for c in df.columns if c.startswith("left.")]
-    right_cols = [c for c in df.columns if c.startswith("right.")]
+    cols = df.columns
     
-    rows = []
-    for _, row in df.iterrows():
-        subject_id = row["subject_id"]
-        
-        # Left side
-        if left_cols:
-            left_row = {"subject_id": subject_id, "side": "left"}
-            for c in left_cols:
-                new_name = c.replace("left.", "")
-                left_row[new_name] = row[c]
-            rows.append(left_row)
-        
-        # Right side
-        if right_cols:
-            right_row = {"subject_id": subject_id, "side": "right"}
-            for c in right_cols:
-                new_name = c.replace("right.", "")
-                right_row[new_name] = row[c]
-            rows.append(right_row)
-    
-    df_long = pd.DataFrame(rows)
+    # Stack one block per side, keyed by the original row position
+    side_frames = []
+    for side_name in ("left", "right"):
+        prefix = f"{side_name}."
+        side_mask = cols.str.startswith(prefix)
+        if not side_mask.any():
+            continue
+        side_df = df.loc[:, side_mask].set_axis(cols[side_mask].str.removeprefix(prefix), axis=1)
+        side_df.insert(0, "side", side_name)
+        side_df.insert(0, "subject_id", df["subject_id"])
+        side_frames.append(side_df)
+    
+    if side_frames:
+        # Stable sort on the original index interleaves sides per subject
+        df_long = (
+            pd.concat(side_frames)
+            .sort_index(kind="stable")
+            .reset_index(drop=True)
+        )
+        df_long["subject_id"] = df_long["subject_id"].astype("category")
+        df_long["side"] = df_long["side"].astype("category")
+    else:
+        df_long = pd.DataFrame()
     
     # Handle sides
     df_long, grouping_vars = _handle_sides(df_long, side)
     
     # Identify outcome columns
-    meta_cols = {"subject_id", "side"}
-    outcome_vars = [c for c in df_long.columns if c not in meta_cols]
+    meta_cols = ["subject_id", "side"]
+    outcome_vars = df_long.columns.difference(meta_cols, sort=False).tolist()
     
     return create_analysis_dataset(
         data=df_long,
@@ -1046,8 +1061,8 @@ def prepare_baseline_questionnaires(
         df = _convert_percentages_to_proportions(df)
     
     # Identify outcome columns
-    meta_cols = {"subject_id"}
-    outcome_vars = [c for c in df.columns if c not in meta_cols]
+    meta_cols = ["subject_id"]
+    outcome_vars = df.columns.difference(meta_cols, sort=False).tolist()
     
     return create_analysis_dataset(
         data=df,
@@ -1192,8 +1207,8 @@ def prepare_daily_workload(
     df = df.sort_values(["subject_id", "date"]).reset_index(drop=True)
     
     # Identify outcome columns
-    meta_cols = {"subject_id", "date", "day_index", "weekday"}
-    outcome_vars = [c for c in df.columns if c not in meta_cols]
+    meta_cols = ["subject_id", "date", "day_index", "weekday"]
+    outcome_vars = df.columns.difference(meta_cols, sort=False).tolist()
     
     return create_analysis_dataset(
         data=df,
@@ -1271,8 +1286,8 @@ def prepare_daily_pain(
     df = df.sort_values(["subject_id", "date"]).reset_index(drop=True)
     
     # Identify outcome columns
-    meta_cols = {"subject_id", "date", "day_index", "weekday"}
-    outcome_vars = [c for c in df.columns if c not in meta_cols]
+    meta_cols = ["subject_id", "date", "day_index", "weekday"]
+    outcome_vars = df.columns.difference(meta_cols, sort=False).tolist()
     
     return create_analysis_dataset(
         data=df,
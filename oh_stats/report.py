@@ -54,43 +54,27 @@ def descriptive_table(
     
     summary = summarize_outcomes(ds, outcomes, by_group=by_group is not None)
     
-    rows = []
+    if summary.empty:
+        return pd.DataFrame()
     
-    # Use format_spec directly (e.g., ".2f")
-    fmt = format_spec
+    # Compile format_spec (e.g., ".2f") into a formatter once
+    num = ("{:" + format_spec + "}").format
     
-    for _, row in summary.iterrows():
-        outcome = row["outcome"]
-        n = row.get("n", 0)
-        
-        # Format mean (SD)
-        mean_sd = f"{row['mean']:{fmt}} ({row['std']:{fmt}})"
-        
-        # Format median [IQR]
-        median_iqr = f"{row['median']:{fmt}} [{row['p25']:{fmt}}-{row['p75']:{fmt}}]"
-        
-        # Format range
-        range_str = f"{row['min']:{fmt}} - {row['max']:{fmt}}"
-        
-        table_row = {
-            "Outcome": outcome,
-            "N": int(n),
-            "Mean (SD)": mean_sd,
-            "Median [IQR]": median_iqr,
-            "Range": range_str,
-        }
-        
-        if by_group and by_group in row:
-            table_row["Group"] = row[by_group]
-        
-        rows.append(table_row)
+    def col(name: str) -> pd.Series:
+        return summary[name].map(num)
     
-    df = pd.DataFrame(rows)
+    columns = {"Outcome": summary["outcome"]}
+    if include_n:
+        columns["N"] = summary["n"].astype(int)
+    columns["Mean (SD)"] = col("mean") + " (" + col("std") + ")"
+    columns["Median [IQR]"] = col("median") + " [" + col("p25") + "-" + col("p75") + "]"
+    columns["Range"] = col("min") + " - " + col("max")
     
-    if not include_n:
-        df = df.drop(columns=["N"])
+    if by_group and by_group in summary.columns:
+        columns["Group"] = summary[by_group]
     
-    return df
+    # Single construction; no post-hoc insert/drop copies
+    return pd.DataFrame(columns)
 
 
 def descriptive_table_formatted(
@@ -108,22 +92,28 @@ def descriptive_table_formatted(
     """
     summary = summarize_outcomes(ds, outcomes)
     
-    rows = []
-    for _, row in summary.iterrows():
-        table_row = {"Outcome": row["outcome"]}
-        
-        if style == "mean_sd":
-            table_row["Summary"] = f"{row['mean']:.2f} ± {row['std']:.2f}"
-        elif style == "median_iqr":
-            table_row["Summary"] = f"{row['median']:.2f} ({row['p25']:.2f}-{row['p75']:.2f})"
-        else:
-            table_row["Mean ± SD"] = f"{row['mean']:.2f} ± {row['std']:.2f}"
-            table_row["Median (IQR)"] = f"{row['median']:.2f} ({row['p25']:.2f}-{row['p75']:.2f})"
-        
-        table_row["N"] = int(row["n"])
-        rows.append(table_row)
+    if summary.empty:
+        return pd.DataFrame()
+    
+    num = "{:.2f}".format
+    
+    def col(name: str) -> pd.Series:
+        return summary[name].map(num)
+    
+    mean_sd = col("mean") + " ± " + col("std")
+    median_iqr = col("median") + " (" + col("p25") + "-" + col("p75") + ")"
     
-    return pd.DataFrame(rows)
+    df = pd.DataFrame({"Outcome": summary["outcome"]})
+    if style == "mean_sd":
+        df["Summary"] = mean_sd
+    elif style == "median_iqr":
+        df["Summary"] = median_iqr
+    else:
+        df["Mean ± SD"] = mean_sd
+        df["Median (IQR)"] = median_iqr
+    df["N"] = summary["n"].astype(int)
+    
+    return df
 
 
 # =============================================================================
@@ -148,38 +138,37 @@ def coefficient_table(
     if result["coefficients"].empty:
         return pd.DataFrame({"Note": ["Model not fitted or no coefficients"]})
     
-    df = result["coefficients"].copy()
+    coef = result["coefficients"]
     
     # Format estimate with CI
-    df["Estimate (95% CI)"] = df.apply(
-        lambda r: f"{r['estimate']:{format_estimate[1:-1]}} ({r['ci_lower']:{format_ci[1:-1]}}, {r['ci_upper']:{format_ci[1:-1]}})",
-        axis=1
+    est_ci = (
+        coef["estimate"].map(format_estimate.format)
+        + " (" + coef["ci_lower"].map(format_ci.format)
+        + ", " + coef["ci_upper"].map(format_ci.format) + ")"
     )
     
     # Format p-value with significance stars
-    def format_pval(p):
-        if np.isnan(p):
-            return "NA"
-        stars = ""
-        if p < 0.001:
-            stars = "***"
-        elif p < 0.01:
-            stars = "**"
-        elif p < 0.05:
-            stars = "*"
-        return f"{p:{format_p[1:-1]}}{stars}"
-    
-    df["P-value"] = df["p_value"].apply(format_pval)
-    
-    # Select and rename columns
-    output = df[["term", "Estimate (95% CI)", "std_error", "z_value", "P-value"]].copy()
-    output = output.rename(columns={
-        "term": "Term",
-        "std_error": "SE",
-        "z_value": "Z",
-    })
-    
-    return output
+    p = coef["p_value"].to_numpy(dtype=float)
+    p_text = np.char.add(_format_array(p, format_p), _significance_stars(p))
+    p_value = np.where(np.isnan(p), "NA", p_text)
+    
+    return pd.DataFrame({
+        "Term": coef["term"],
+        "Estimate (95% CI)": est_ci,
+        "SE": coef["std_error"],
+        "Z": coef["z_value"],
+        "P-value": p_value,
+    }, index=coef.index)
+
+
+def _significance_stars(p: np.ndarray) -> np.ndarray:
+    """Map p-values to "***" (<0.001), "**" (<0.01), "*" (<0.05) or ""."""
+    return np.select([p < 0.001, p < 0.01, p < 0.05], ["***", "**", "*"], default="")
+
+
+def _format_array(values: np.ndarray, template: str) -> np.ndarray:
+    """Format each value with a str.format template into a string array."""
+    return np.array([template.format(v) for v in values], dtype=str)
 
 
 def coefficient_table_multiple(
@@ -198,7 +187,7 @@ def coefficient_table_multiple(
     else:
         results_list = results
     
-    rows = []
+    frames = []
     
     for result in results_list:
         if result["coefficients"].empty:
@@ -209,17 +198,24 @@ def coefficient_table_multiple(
         if term_filter:
             coef_df = coef_df[coef_df["term"].str.contains(term_filter, na=False)]
         
-        for _, row in coef_df.iterrows():
-            rows.append({
-                "Outcome": result["outcome"],
-                "Term": row["term"],
-                "Estimate": row["estimate"],
-                "SE": row["std_error"],
-                "95% CI": f"({row['ci_lower']:.3f}, {row['ci_upper']:.3f})",
-                "P-value": row["p_value"],
-            })
-    
-    return pd.DataFrame(rows)
+        frames.append(coef_df.assign(outcome=result["outcome"]))
+    
+    coefs = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if coefs.empty:
+        return pd.DataFrame()
+    
+    ci = "{:.3f}".format
+    
+    return pd.DataFrame({
+        "Outcome": coefs["outcome"],
+        "Term": coefs["term"],
+        "Estimate": coefs["estimate"],
+        "SE": coefs["std_error"],
+        "95% CI": (
+            "(" + coefs["ci_lower"].map(ci) + ", " + coefs["ci_upper"].map(ci) + ")"
+        ),
+        "P-value": coefs["p_value"],
+    })
 
 
 # =============================================================================
@@ -244,33 +240,28 @@ def results_summary(
     else:
         results_list = results
     
-    rows = []
+    n_results = len(results_list)
+    columns = {
+        "Outcome": [r["outcome"] for r in results_list],
+        "N_obs": np.fromiter((r["n_obs"] for r in results_list), dtype=np.int64, count=n_results),
+        "N_subjects": np.fromiter((r["n_groups"] for r in results_list), dtype=np.int64, count=n_results),
+        "Converged": np.fromiter((r["converged"] for r in results_list), dtype=bool, count=n_results),
+    }
     
-    for result in results_list:
-        row = {
-            "Outcome": result["outcome"],
-            "N_obs": result["n_obs"],
-            "N_subjects": result["n_groups"],
-            "Converged": result["converged"],
-        }
-        
-        if include_fit_stats:
-            row["AIC"] = result["fit_stats"].get("aic", np.nan)
-            row["BIC"] = result["fit_stats"].get("bic", np.nan)
-            row["ICC"] = result["random_effects"].get("icc", np.nan)
-        
-        if result["warnings"]:
-            row["Warnings"] = len(result["warnings"])
-        
-        rows.append(row)
+    if include_fit_stats:
+        columns["AIC"] = [r["fit_stats"].get("aic", np.nan) for r in results_list]
+        columns["BIC"] = [r["fit_stats"].get("bic", np.nan) for r in results_list]
+        columns["ICC"] = [r["random_effects"].get("icc", np.nan) for r in results_list]
+    
+    if any(r["warnings"] for r in results_list):
+        columns["Warnings"] = [len(r["warnings"]) if r["warnings"] else np.nan for r in results_list]
     
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame(columns)
     
-    # Merge FDR results if provided
+    # Join FDR results if provided
     if fdr_results is not None and not fdr_results.empty:
-        fdr_subset = fdr_results[["outcome", "p_raw", "p_adjusted", "significant"]].copy()
-        fdr_subset = fdr_subset.rename(columns={"outcome": "Outcome"})
-        df = df.merge(fdr_subset, on="Outcome", how="left")
+        fdr_subset = fdr_results.set_index("outcome")[["p_raw", "p_adjusted", "significant"]]
+        df = df.set_index("Outcome").join(fdr_subset).reset_index()
     
     return df
 
@@ -288,6 +279,25 @@ def export_to_csv(
     table.to_csv(filepath, index=False, **kwargs)
 
 
+def export_to_parquet(
+    table: pd.DataFrame,
+    filepath: str,
+    compression: str = "snappy",
+) -> None:
+    """
+    Export table to a Parquet file (requires pyarrow).
+    
+    Parquet is columnar and typed: files are smaller than CSV, reload
+    faster, and a subset of columns can be read without parsing the rest
+    (e.g. ``pd.read_parquet(path, columns=["Outcome", "p_adjusted"])``).
+    
+    :param table: DataFrame to export
+    :param filepath: Output file path
+    :param compression: Parquet compression codec ("snappy", "gzip", "zstd", None)
+    """
+    table.to_parquet(filepath, engine="pyarrow", compression=compression, index=False)
+
+
 def export_to_latex(
     table: pd.DataFrame,
     filepath: Optional[str] = None,
@@ -321,29 +331,45 @@ def export_to_latex(
 # Print Functions
 # =============================================================================
 
+def _count_true(df: pd.DataFrame, column: str) -> int:
+    """Count True values in a boolean-like column (missing counts as False)."""
+    if column not in df.columns:
+        return 0
+    return int(np.count_nonzero(df[column].to_numpy(dtype=bool, na_value=False)))
+
+
 def print_results_summary(
     results: Union[List[LMMResult], Dict[str, LMMResult]],
     fdr_results: Optional[pd.DataFrame] = None,
+    max_rows: Optional[int] = 50,
 ) -> None:
-    """Print a human-readable results summary."""
+    """
+    Print a human-readable results summary.
+    
+    :param results: List or dict of LMMResult dictionaries
+    :param fdr_results: Optional FDR correction results from apply_fdr()
+    :param max_rows: Longer tables show only the first and last rows
+        (hidden rows are never formatted); None prints every row
+    """
     summary = results_summary(results, fdr_results)
     
     print("=" * 70)
     print("LMM RESULTS SUMMARY")
     print("=" * 70)
     
-    n_converged = summary["Converged"].sum()
     n_total = len(summary)
+    n_converged = _count_true(summary, "Converged")
+    pct_converged = 100 * n_converged / n_total if n_total else 0.0
     
     print(f"\nModels fitted: {n_total}")
-    print(f"Converged: {n_converged} ({100*n_converged/n_total:.0f}%)")
+    print(f"Converged: {n_converged} ({pct_converged:.0f}%)")
     
     if "significant" in summary.columns:
-        n_sig = summary["significant"].sum()
+        n_sig = _count_true(summary, "significant")
         print(f"Significant (FDR q<0.05): {n_sig}")
     
     print("\n" + "-" * 70)
-    print(summary.to_string(index=False))
+    print(summary.to_string(index=False, max_rows=max_rows))
     print("-" * 70)
 
 
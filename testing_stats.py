@@ -18,9 +18,6 @@ import sys
 import os
 import warnings
 
-# Suppress some convergence warnings for cleaner output
-warnings.filterwarnings("ignore", category=RuntimeWarning)
-
 from oh_parser import load_profiles, list_subjects
 
 # =============================================================================
@@ -185,12 +182,15 @@ from oh_stats.registry import get_outcome_info, OutcomeType
 
 # Fit single model (primary outcome)
 print("\n--- Single Model: EMG Mean %MVC ---")
-result = fit_lmm(
-    ds,
-    outcome="EMG_intensity.mean_percent_mvc",
-    fixed_effects=["C(day_index)", "C(side)"],  # Day + Side as categorical
-    random_intercept="subject_id",
-)
+# Convergence RuntimeWarnings are silenced only around the fit calls
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", category=RuntimeWarning)
+    result = fit_lmm(
+        ds,
+        outcome="EMG_intensity.mean_percent_mvc",
+        fixed_effects=["C(day_index)", "C(side)"],  # Day + Side as categorical
+        random_intercept="subject_id",
+    )
 print(summarize_lmm_result(result))
 print("\nCoefficients:")
 print(result['coefficients'].to_string(index=False))
@@ -241,7 +241,9 @@ valid_outcomes = get_non_degenerate_outcomes(ds, continuous_outcomes[:10])  # Li
 print(f"Non-degenerate outcomes: {len(valid_outcomes)}")
 
 # Fit all
-results = fit_all_outcomes(ds, outcomes=valid_outcomes[:5], skip_degenerate=True)
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", category=RuntimeWarning)
+    results = fit_all_outcomes(ds, outcomes=valid_outcomes[:5], skip_degenerate=True)
 print(f"\nFitted {len(results)} models")
 
 for name, r in results.items():
@@ -272,12 +274,14 @@ print("\n--- Model Comparison ---")
 from oh_stats import compare_models
 
 # Fit a simpler model (no side effect) for comparison
-result_simple = fit_lmm(
-    ds,
-    outcome="EMG_intensity.mean_percent_mvc",
-    fixed_effects=["C(day_index)"],  # Only day, no side
-    random_intercept="subject_id",
-)
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", category=RuntimeWarning)
+    result_simple = fit_lmm(
+        ds,
+        outcome="EMG_intensity.mean_percent_mvc",
+        fixed_effects=["C(day_index)"],  # Only day, no side
+        random_intercept="subject_id",
+    )
 if result_simple['converged'] and result['converged']:
     comparison_df = compare_models([result_simple, result])
     print(comparison_df[["formula", "aic", "delta_aic"]].to_string(index=False))
@@ -0,0 +1,42 @@
+"""
+Tests for oh_stats.prepare dataset builders.
+"""
+import numpy as np
+import pandas as pd
+
+from oh_stats import prepare_from_dataframe, fit_lmm
+
+
+def _workday_dataset():
+    """Eight subjects, two working weeks (Monday-Friday) of one outcome."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2024-01-01", periods=10)
+    df = pd.DataFrame([
+        {"subject_id": f"S{s}", "date": d.strftime("%d-%m-%Y"), "score": rng.normal(10 + s)}
+        for s in range(8)
+        for d in dates
+    ])
+    return prepare_from_dataframe(df, sensor="test", level="daily")
+
+
+def test_weekday_is_plain_day_names():
+    ds = _workday_dataset()
+    weekday = ds["data"]["weekday"]
+    assert not isinstance(weekday.dtype, pd.CategoricalDtype)
+    assert set(weekday) == {"Monday", "Tuesday", "Wednesday", "Thursday", "Friday"}
+
+
+def test_fit_weekday_effect_on_workday_only_data():
+    ds = _workday_dataset()
+    result = fit_lmm(ds, "score", fixed_effects=["C(weekday)"])
+
+    assert result["converged"]
+    terms = set(result["coefficients"]["term"])
+    # Friday is the (alphabetical) reference level; weekend days never appear
+    assert {
+        "C(weekday)[T.Monday]",
+        "C(weekday)[T.Tuesday]",
+        "C(weekday)[T.Wednesday]",
+        "C(weekday)[T.Thursday]",
+    } <= terms
+    assert not any("Saturday" in t or "Sunday" in t or "Friday" in t for t in terms)
@@ -0,0 +1,40 @@
+"""
+Tests for the docs/visualization helper functions.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "docs", "visualization"))
+
+from utils import autofill_nan_groups  # noqa: E402
+
+
+def test_autofill_fills_all_none_object_column_in_group():
+    df = pd.DataFrame({
+        "HR_distributions.low": [0.4, np.nan, np.nan],
+        "HR_distributions.high": pd.Series([None, None, None], dtype=object),
+    })
+
+    out = autofill_nan_groups(df)
+
+    assert out["HR_distributions.high"].dtype == np.float64
+    assert out["HR_distributions.high"].tolist()[0] == 0.0
+    # Rows where the whole group is missing stay missing
+    assert out.loc[1:, ["HR_distributions.low", "HR_distributions.high"]].isna().all().all()
+
+
+def test_autofill_keeps_int_and_skips_text_columns():
+    df = pd.DataFrame({
+        "Noise_distributions.a": [1, 2, 3],
+        "Noise_distributions.b": [np.nan, 5.0, np.nan],
+        "Noise_distributions.label": ["x", "y", "z"],
+    })
+
+    out = autofill_nan_groups(df)
+
+    assert out["Noise_distributions.a"].dtype == np.int64
+    assert out["Noise_distributions.b"].tolist() == [0.0, 5.0, 0.0]
+    assert out["Noise_distributions.label"].tolist() == ["x", "y", "z"]